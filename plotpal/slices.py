@@ -1,3 +1,5 @@
+from concurrent.futures import ThreadPoolExecutor
+
 import numpy as np
 import matplotlib
 matplotlib.use('Agg')
@@ -11,6 +13,47 @@ from plotpal.plot_grid import RegularColorbarPlotGrid
 import logging
 logger = logging.getLogger(__name__.split('.')[-1])
 
+#Shared cartopy transform for orthographic plots; cartopy is only imported when one is first made.
+_PLATE_CARREE = None
+
+def _get_plate_carree():
+    """ Returns the shared cartopy PlateCarree transform, creating it on first use """
+    global _PLATE_CARREE
+    if _PLATE_CARREE is None:
+        try:
+            import cartopy.crs as ccrs
+            _PLATE_CARREE = ccrs.PlateCarree()
+        except Exception:
+            raise ImportError("Cartopy must be installed for plotpal Orthographic plots")
+    return _PLATE_CARREE
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+
+if NUMBA_AVAILABLE:
+    @njit(fastmath=True, cache=True)
+    def _x_mean_std(field):
+        """ Returns the mean and standard deviation of a 2D field over its first (x) axis """
+        #Loop over rows in the outer loop so the (C-ordered) field is read contiguously.
+        nx, ny = field.shape
+        mean = np.zeros(ny)
+        std = np.zeros(ny)
+        for i in range(nx):
+            for j in range(ny):
+                mean[j] += field[i,j]
+        for j in range(ny):
+            mean[j] /= nx
+        for i in range(nx):
+            for j in range(ny):
+                std[j] += (field[i,j] - mean[j])**2
+        for j in range(ny):
+            std[j] = np.sqrt(std[j] / nx)
+        return mean, std
+
 
 class Colormesh:
     """ A struct containing information about a slice colormesh plot    """
@@ -18,7 +61,8 @@ class Colormesh:
     def __init__(self, task, vector_ind=None, x_basis='x', y_basis='z', cmap='RdBu_r', label=None,
                  remove_mean=False, remove_x_mean=False, divide_x_std=False, pos_def=False,
                  vmin=None, vmax=None, log=False, cmap_exclusion=0.005,
-                 linked_cbar_cm=None, linked_profile_cm=None, transpose=False):
+                 linked_cbar_cm=None, linked_profile_cm=None, transpose=False,
+                 recompute_every=1, minmax_ema=0):
         """
         Initialize the object
         
@@ -54,6 +98,10 @@ class Colormesh:
             A Colormesh object that this object shares a mean profile with
         transpose (bool) :
             If True, transpose the colormap when plotting; useful when x_basis has an index after y_basis in dedalus data.
+        recompute_every (int) :
+            Recompute the colormap min/max values every this many frames and reuse them in between. The default of 1 recomputes them every frame.
+        minmax_ema (float) :
+            If nonzero, the weight (0 <= minmax_ema < 1) of the previous min/max values in an exponential moving average with newly recomputed values.
         """
         self.task, self.vector_ind, self.x_basis, self.y_basis = task, vector_ind, x_basis, y_basis
         self.remove_mean, self.remove_x_mean, self.divide_x_std = remove_mean, remove_x_mean, divide_x_std
@@ -62,13 +110,27 @@ class Colormesh:
         self.vmax, self.vmin = vmax, vmin
         self.linked_cbar_cm, self.linked_profile_cm = linked_cbar_cm, linked_profile_cm
         self.transpose = transpose
+        if isinstance(recompute_every, bool) or not isinstance(recompute_every, (int, np.integer)) or recompute_every < 1:
+            raise ValueError("recompute_every must be an integer >= 1")
+        if isinstance(minmax_ema, bool) or not isinstance(minmax_ema, (int, float, np.integer, np.floating)) or not 0 <= minmax_ema < 1:
+            raise ValueError("minmax_ema must be a number with 0 <= minmax_ema < 1")
+        self.recompute_every, self.minmax_ema = recompute_every, minmax_ema
 
         self.first = True
+        self._frame_counter = 0
+        self._cached_vmin, self._cached_vmax = None, None
         self.xx, self.yy = None, None
+        self.use_imshow, self.extent = False, None
         self.color_plot = None
+        self.cb, self.minmax_text = None, None
+        self.labeled_minmax = None
+
+    def _use_numba(self, field):
+        """ Whether the numba x-mean/x-stdev kernel can be used on this field """
+        return NUMBA_AVAILABLE and field.ndim == 2 and field.dtype in (np.float32, np.float64)
 
     def _modify_field(self, field):
-        """ Modify the colormap field before plotting; e.g., remove mean, etc. """
+        """ Modify the colormap field (a writable copy, see process_field) in place before plotting; e.g., remove mean, etc. """
         if self.linked_profile_cm is not None:
             # Use the same mean and std as another Colormesh object if specified.
             self.removed_mean = self.linked_profile_cm.removed_mean
@@ -77,16 +139,20 @@ class Colormesh:
             self.removed_mean = 0
             self.divided_std = 1
 
+            #With numba, get the x-mean and x-stdev in one compiled, cache-friendly pass.
+            x_mean, x_std = None, None
+            if (self.remove_x_mean or self.divide_x_std) and self._use_numba(field):
+                x_mean, x_std = _x_mean_std(field)
 
             #Remove specified mean
             if self.remove_mean:
                 self.removed_mean = np.mean(field)
             elif self.remove_x_mean:
-                self.removed_mean = np.mean(field, axis=0)
+                self.removed_mean = np.mean(field, axis=0) if x_mean is None else x_mean
 
             #Scale field by the stdev to bring out low-amplitude dynamics.
             if self.divide_x_std:
-                self.divided_std = np.std(field, axis=0)
+                self.divided_std = np.std(field, axis=0) if x_std is None else x_std
                 if type(self) == MeridionalColormesh or type(self) == PolarColormesh:
                     if self.r_pad[0] == 0:
                         #set interior 4% of points to have a smoothly varying std
@@ -96,11 +162,13 @@ class Colormesh:
                         indx = np.arange(N)
                         smoother = mean_val + (bound_val - mean_val)*indx/N
                         self.divided_std[:N] = smoother
+
         field -= self.removed_mean
         field /= self.divided_std
 
         if self.log: 
-            field = np.log10(np.abs(field))
+            np.abs(field, out=field)
+            np.log10(field, out=field)
 
         return field
 
@@ -109,19 +177,24 @@ class Colormesh:
         if self.linked_cbar_cm is not None:
             # Use the same min/max as another Colormesh object if specified.
             return self.linked_cbar_cm.current_vmin, self.linked_cbar_cm.current_vmax
+        elif self.vmin is not None and self.vmax is not None:
+            # Both limits are fixed by the user, so there's no need to look at the field.
+            return self.vmin, self.vmax
         else:
-            vals = np.sort(field.flatten())
+            # np.partition selects the needed order statistic in O(N) rather than sorting the whole field.
+            flat = field.ravel()
             if self.pos_def:
                 #If the profile is positive definite, set the colormap to span from the max/min to zero.
-                vals = np.sort(vals)
-                if np.mean(vals) < 0:
-                    vmin, vmax = vals[int(self.cmap_exclusion*len(vals))], 0
+                if np.mean(field) < 0:
+                    k = int(self.cmap_exclusion*flat.size)
+                    vmin, vmax = np.partition(flat, k)[k], 0
                 else:
-                    vmin, vmax = 0, vals[int((1-self.cmap_exclusion)*len(vals))]
+                    k = int((1-self.cmap_exclusion)*flat.size)
+                    vmin, vmax = 0, np.partition(flat, k)[k]
             else:
                 #Otherwise, set the colormap to span from the +/- abs(max) values.
-                vals = np.sort(np.abs(vals))
-                vmax = vals[int((1-self.cmap_exclusion)*len(vals))]
+                k = int((1-self.cmap_exclusion)*flat.size)
+                vmax = np.partition(np.abs(flat), k)[k]
                 vmin = -vmax
 
             if self.vmin is not None:
@@ -131,18 +204,32 @@ class Colormesh:
 
             return vmin, vmax
 
+    def _set_meshgrid(self, x, y):
+        """ Store float32 x and y coordinate meshes as read-only broadcast views of the 1D coordinate arrays """
+        x = np.ascontiguousarray(x, dtype=np.float32)
+        y = np.ascontiguousarray(y, dtype=np.float32)
+        self.yy, self.xx = np.meshgrid(y, x, copy=False)
+
     def _get_pcolormesh_coordinates(self, dset):
         """ make the x and y coordinates for pcolormesh """
         x = match_basis(dset, self.x_basis)
         y = match_basis(dset, self.y_basis)
-        self.yy, self.xx = np.meshgrid(y, x)
+        self._set_meshgrid(x, y)
+
+        #Uniformly spaced, ascending grids can be drawn as a single image with imshow, which is much cheaper than a QuadMesh.
+        if len(x) > 1 and len(y) > 1:
+            dx, dy = x[1] - x[0], y[1] - y[0]
+            if dx > 0 and dy > 0 and np.allclose(np.diff(x), dx, atol=0) and np.allclose(np.diff(y), dy, atol=0):
+                self.use_imshow = True
+                self.extent = (x[0] - dx/2, x[-1] + dx/2, y[0] - dy/2, y[-1] + dy/2)
 
     def _setup_colorbar(self, plot, cax, vmin, vmax):
-        """ Create the colorbar on the axis 'cax' and label it """
+        """ Create the colorbar on the axis 'cax' and label it; called on the first frame only """
         cb = plt.colorbar(plot, cax=cax, orientation='horizontal')
         cb.solids.set_rasterized(True)
         cb.set_ticks(())
-        cax.text(-0.01, 0.5, r'$_{{{:.2e}}}^{{{:.2e}}}$'.format(vmin, vmax), transform=cax.transAxes, ha='right', va='center')
+        self.minmax_text = cax.text(-0.01, 0.5, self._minmax_label(vmin, vmax), transform=cax.transAxes, ha='right', va='center')
+        self.labeled_minmax = (vmin, vmax)
         if  self.linked_cbar_cm is None:
             if self.label is None:
                 if self.vector_ind is not None:
@@ -153,7 +240,65 @@ class Colormesh:
                 cax.text(1.05, 0.5, '{:s}'.format(self.label), transform=cax.transAxes, va='center', ha='left')
         return cb
 
-    def plot_colormesh(self, ax, cax, dset, ni, **kwargs):
+    def _update_colorbar(self, vmin, vmax):
+        """ Update the min/max label of the existing colorbar; the colorbar itself follows the plot's clim """
+        if (vmin, vmax) == self.labeled_minmax:
+            #Nothing to update, e.g. when the min/max values are cached or fixed by the user.
+            return
+        self.minmax_text.set_text(self._minmax_label(vmin, vmax))
+        self.labeled_minmax = (vmin, vmax)
+
+    @staticmethod
+    def _minmax_label(vmin, vmax):
+        """ The text label showing the min and max values of the colorbar """
+        return '$_{' + format(vmin, '.2e') + '}^{' + format(vmax, '.2e') + '}$'
+
+    def process_field(self, dset, data):
+        """
+        Get the field to plot and its colormap limits. This does not touch any matplotlib objects,
+        so it is safe to call for several colormeshes at once from different threads.
+
+        Parameters
+        ----------
+        dset : hdf5 dataset
+            The dataset to plot; used for its basis coordinates.
+        data : numpy array
+            The data of the dataset at the time step to plot (only the vector_ind component, for vector fields).
+
+        Returns
+        -------
+        field : numpy array
+            The modified field, ready to be passed to plot_colormesh().
+        """
+        if self.first:
+            self._get_pcolormesh_coordinates(dset)
+
+        field = np.squeeze(data)
+        #Copy, since the field is modified in place and data may be shared with other colormeshes.
+        #Removing the mean needs full precision: a small fluctuation about a large mean is lost in float32.
+        field = np.array(field, dtype=np.result_type(field, np.float64))
+        field = self._modify_field(field)
+
+        #Once the mean is removed, single precision is plenty for the colormap and halves the memory
+        #traffic of the min/max search and of matplotlib's normalization.
+        field = np.ascontiguousarray(field.real, dtype=np.float32)
+        if self.linked_cbar_cm is not None or self._frame_counter % self.recompute_every == 0:
+            vmin, vmax = self._get_minmax(field)
+            if not self.first and self.linked_cbar_cm is None and self.minmax_ema:
+                vmin = self.minmax_ema*self._cached_vmin + (1-self.minmax_ema)*vmin
+                vmax = self.minmax_ema*self._cached_vmax + (1-self.minmax_ema)*vmax
+            self._cached_vmin, self._cached_vmax = vmin, vmax
+        else:
+            #Reuse the min/max values from the last recompute.
+            vmin, vmax = self._cached_vmin, self._cached_vmax
+        self._frame_counter += 1
+        self.current_vmin, self.current_vmax = vmin, vmax
+
+        if self.transpose:
+            field = field.T
+        return field
+
+    def plot_colormesh(self, ax, cax, field, **kwargs):
         """ 
         Plot the colormesh
         
@@ -163,45 +308,50 @@ class Colormesh:
             The axis to plot the colormesh on.
         cax : matplotlib axis
             The axis to plot the colorbar on.
-        dset : hdf5 dataset
-            The dataset to plot.
-        ni : int
-            The index of the time step to plot.
+        field : numpy array
+            The field to plot, as returned by process_field().
         **kwargs : dict
-            Additional keyword arguments to pass to matplotlib.pyplot.pcolormesh.
+            Additional keyword arguments to pass to matplotlib.pyplot.pcolormesh. Uniformly spaced x and y bases are drawn with imshow instead, unless kwargs other than 'rasterized' or 'shading' are given.
         """
-        if self.first:
-            self._get_pcolormesh_coordinates(dset)
-
-        field = np.squeeze(dset[ni,:])
-        vector_ind = self.vector_ind
-        if vector_ind is not None:
-            field = field[vector_ind,:]
-
-        field = self._modify_field(field)
-        vmin, vmax = self._get_minmax(field)
-        self.current_vmin, self.current_vmax = vmin, vmax
+        vmin, vmax = self.current_vmin, self.current_vmax
 
         if 'rasterized' not in kwargs.keys():
             kwargs['rasterized'] = True
         if 'shading' not in kwargs.keys():
+            #Cell-centered coordinates with the same shape as the field; no separate cell-corner arrays are needed.
             kwargs['shading'] = 'nearest'
 
-        if self.transpose:
-            field = field.T
-        self.color_plot = ax.pcolormesh(self.xx, self.yy, field.real, cmap=self.cmap, vmin=vmin, vmax=vmax, **kwargs)
-        cb = self._setup_colorbar(self.color_plot, cax, vmin, vmax)
+        #kwargs are meant for pcolormesh, so only use imshow if none beyond these defaults were given.
+        use_imshow = self.use_imshow and kwargs['shading'] == 'nearest' and set(kwargs.keys()) <= {'rasterized', 'shading'}
+        if self.first:
+            if use_imshow:
+                kwargs.pop('shading')
+                self.color_plot = ax.imshow(field.real.T, extent=self.extent, cmap=self.cmap, vmin=vmin, vmax=vmax,
+                                            origin='lower', aspect='auto', interpolation='nearest', **kwargs)
+            else:
+                self.color_plot = ax.pcolormesh(self.xx, self.yy, field.real, cmap=self.cmap, vmin=vmin, vmax=vmax, **kwargs)
+            self.cb = self._setup_colorbar(self.color_plot, cax, vmin, vmax)
+        else:
+            #Reuse the existing artist and colorbar; the colorbar follows the mappable's clim.
+            if use_imshow:
+                self.color_plot.set_data(field.real.T)
+            else:
+                self.color_plot.set_array(field.real.ravel())
+            self.color_plot.set_clim(vmin, vmax)
+            self._update_colorbar(vmin, vmax)
         self.first = False
-        return self.color_plot, cb
+        return self.color_plot, self.cb
 
 
 class CartesianColormesh(Colormesh):
      """ Colormesh logic specific to Cartesian coordinates """
 
-     def plot_colormesh(self, ax, cax, dset, ni, **kwargs):
-        plot, cb = super().plot_colormesh(ax, cax, dset, ni, **kwargs)
-        ax.set_xticks([])
-        ax.set_yticks([])
+     def plot_colormesh(self, ax, cax, field, **kwargs):
+        first = self.first
+        plot, cb = super().plot_colormesh(ax, cax, field, **kwargs)
+        if first:
+            ax.set_xticks([])
+            ax.set_yticks([])
         return plot, cb
 
 
@@ -217,26 +367,35 @@ class PolarColormesh(Colormesh):
         if r_outer is None:
             r_outer = 1
         self.r_pad = (r_inner, r_outer)
+        self.padded_field = None
 
     def _modify_field(self, field):
         field = super()._modify_field(field)
-        field = np.pad(field, ((0, 1), (1, 1)), mode='edge')
-        field[-1,:] = field[0,:] #set 2pi value == 0 value.
-        return field
+        #Edge-pad the field in r, reusing the same buffer every frame.
+        padded = self.padded_field
+        field = field.real
+        padded[:,1:-1] = field
+        padded[:,0] = field[:,0]
+        padded[:,-1] = field[:,-1]
+        return padded
 
     def _get_pcolormesh_coordinates(self, dset):
-        x = phi = match_basis(dset, self.azimuth_basis)
-        y = r   = match_basis(dset, self.radial_basis)
-        phi = np.append(x, 2*np.pi)
+        phi = match_basis(dset, self.azimuth_basis)
+        r   = match_basis(dset, self.radial_basis)
+        #With nearest shading the phi cells already cover [0, 2pi), but the r_pad points are needed
+        #to extend the plot to the inner and outer radii.
         r = np.pad(r, ((1,1)), mode='constant', constant_values=self.r_pad)
-        self.yy, self.xx = np.meshgrid(r, phi)
-
-    def plot_colormesh(self, ax, cax, dset, ni, **kwargs):
-        plot, cb = super().plot_colormesh(ax, cax, dset, ni, **kwargs)
-        ax.set_xticks([])
-        ax.set_yticks([])
-        ax.set_ylim(0, self.r_pad[1])
-        ax.set_aspect(1)
+        self._set_meshgrid(phi, r)
+        self.padded_field = np.empty(self.xx.shape, dtype=np.float32)
+
+    def plot_colormesh(self, ax, cax, field, **kwargs):
+        first = self.first
+        plot, cb = super().plot_colormesh(ax, cax, field, **kwargs)
+        if first:
+            ax.set_xticks([])
+            ax.set_yticks([])
+            ax.set_ylim(0, self.r_pad[1])
+            ax.set_aspect(1)
         return plot, cb
 
 
@@ -249,16 +408,19 @@ class MollweideColormesh(Colormesh):
         self.azimuth_basis = self.x_basis
 
     def _get_pcolormesh_coordinates(self, dset):
-        x = phi = match_basis(dset, self.azimuth_basis)
-        y = theta = match_basis(dset, self.colatitude_basis)
-        phi -= np.pi
-        theta = np.pi/2 - theta
-        self.yy, self.xx = np.meshgrid(theta, phi)
-
-    def plot_colormesh(self, ax, cax, dset, ni, **kwargs):
-        plot, cb = super().plot_colormesh(ax, cax, dset, ni, **kwargs)
-        ax.yaxis.set_major_locator(plt.NullLocator())
-        ax.xaxis.set_major_formatter(plt.NullFormatter())
+        #Work on copies so the basis arrays returned by match_basis are never modified.
+        phi = np.array(match_basis(dset, self.azimuth_basis), dtype=np.float32)
+        theta = np.array(match_basis(dset, self.colatitude_basis), dtype=np.float32)
+        np.subtract(phi, np.pi, out=phi)
+        np.subtract(np.pi/2, theta, out=theta)
+        self._set_meshgrid(phi, theta)
+
+    def plot_colormesh(self, ax, cax, field, **kwargs):
+        first = self.first
+        plot, cb = super().plot_colormesh(ax, cax, field, **kwargs)
+        if first:
+            ax.yaxis.set_major_locator(plt.NullLocator())
+            ax.xaxis.set_major_formatter(plt.NullFormatter())
         return plot, cb
 
 
@@ -269,24 +431,23 @@ class OrthographicColormesh(Colormesh):
         super().__init__(field, x_basis=azimuth_basis, y_basis=colatitude_basis, **kwargs)
         self.colatitude_basis = self.y_basis
         self.azimuth_basis = self.x_basis
-        try:
-            import cartopy.crs as ccrs
-            self.transform = ccrs.PlateCarree()
-        except:
-            raise ImportError("Cartopy must be installed for plotpal Orthographic plots")
+        self.transform = _get_plate_carree()
 
     def _get_pcolormesh_coordinates(self, dset):
-        x = phi = match_basis(dset, self.azimuth_basis)
-        y = theta = match_basis(dset, self.colatitude_basis)
-        phi *= 180/np.pi
-        theta *= 180/np.pi
-        phi -= 180
-        theta -= 90
-        self.yy, self.xx = np.meshgrid(theta, phi)
-
-    def plot_colormesh(self, ax, cax, dset, ni, **kwargs):
-        plot, cb = super().plot_colormesh(ax, cax, dset, ni, transform = self.transform, **kwargs)
-        ax.gridlines()
+        #Work on copies so the basis arrays returned by match_basis are never modified.
+        phi = np.array(match_basis(dset, self.azimuth_basis), dtype=np.float32)
+        theta = np.array(match_basis(dset, self.colatitude_basis), dtype=np.float32)
+        np.multiply(phi, 180/np.pi, out=phi)
+        np.subtract(phi, 180, out=phi)
+        np.multiply(theta, 180/np.pi, out=theta)
+        np.subtract(theta, 90, out=theta)
+        self._set_meshgrid(phi, theta)
+
+    def plot_colormesh(self, ax, cax, field, **kwargs):
+        first = self.first
+        plot, cb = super().plot_colormesh(ax, cax, field, transform = self.transform, **kwargs)
+        if first:
+            ax.gridlines()
         return plot, cb
 
 
@@ -302,16 +463,25 @@ class MeridionalColormesh(Colormesh):
         if r_outer is None:
             r_outer = 1
         self.r_pad = (r_inner, r_outer)
+        self.padded_field = None
         self.left = left
 
     def _modify_field(self, field):
         field = super()._modify_field(field)
-        field = np.pad(field, ((1, 1), (1, 1)), mode='edge')
-        return field
+        #Edge-pad the field in theta and r, reusing the same buffer every frame.
+        padded = self.padded_field
+        field = field.real
+        padded[1:-1,1:-1] = field
+        padded[1:-1,0] = field[:,0]
+        padded[1:-1,-1] = field[:,-1]
+        padded[0,:] = padded[1,:]
+        padded[-1,:] = padded[-2,:]
+        return padded
 
     def _get_pcolormesh_coordinates(self, dset):
         x = theta = match_basis(dset, self.colatitude_basis)
         y = r     = match_basis(dset, self.radial_basis)
+        #The padded points are cell centers that extend the plot to the poles and to r_pad.
         theta = np.pad(theta, ((1,1)), mode='constant', constant_values=(np.pi,0))
         if self.left:
             theta = np.pi/2 + theta
@@ -319,14 +489,17 @@ class MeridionalColormesh(Colormesh):
             #right side
             theta = np.pi/2 - theta
         r = np.pad(r, ((1,1)), mode='constant', constant_values=self.r_pad)
-        self.yy, self.xx = np.meshgrid(r, theta)
-
-    def plot_colormesh(self, ax, cax, dset, ni, **kwargs):
-        plot, cb = super().plot_colormesh(ax, cax, dset, ni, **kwargs)
-        ax.set_xticks([])
-        ax.set_yticks([])
-        ax.set_ylim(0, self.r_pad[1])
-        ax.set_aspect(1)
+        self._set_meshgrid(theta, r)
+        self.padded_field = np.empty(self.xx.shape, dtype=np.float32)
+
+    def plot_colormesh(self, ax, cax, field, **kwargs):
+        first = self.first
+        plot, cb = super().plot_colormesh(ax, cax, field, **kwargs)
+        if first:
+            ax.set_xticks([])
+            ax.set_yticks([])
+            ax.set_ylim(0, self.r_pad[1])
+            ax.set_aspect(1)
         return plot, cb
 
 
@@ -451,7 +624,29 @@ class SlicePlotter(SingleTypeReader):
                     caxs.append(self.grid.cbar_axes[k])
         return axs, caxs
 
-    def plot_colormeshes(self, start_fig=1, dpi=200, **kwargs):
+    def _get_processing_waves(self):
+        """ 
+        Group the colormeshes into waves whose fields can be processed concurrently. 
+        Colormeshes that share a colorbar or mean profile with another colormesh are placed in a later wave than that colormesh.
+        """
+        all_cms = [cm for k, cm in self.colormeshes]
+        waves, done = [], set()
+        remaining = list(all_cms)
+        while len(remaining) > 0:
+            wave = []
+            for cm in remaining:
+                links = [l for l in (cm.linked_cbar_cm, cm.linked_profile_cm) if l is not None and l in all_cms]
+                if all([l in done for l in links]):
+                    wave.append(cm)
+            if len(wave) == 0:
+                #Circularly linked colormeshes; fall back to processing them in order.
+                wave = remaining[:1]
+            waves.append(wave)
+            done.update(wave)
+            remaining = [cm for cm in remaining if cm not in done]
+        return waves
+
+    def plot_colormeshes(self, start_fig=1, dpi=200, max_threads=1, png_compress_level=1, **kwargs):
         """
         Plot figures of the 2D dedalus data slices at each timestep.
 
@@ -460,32 +655,57 @@ class SlicePlotter(SingleTypeReader):
                 The number in the filename for the first write.
             dpi (int) :
                 The pixel density of the output image
+            max_threads (int) :
+                The maximum number of threads used to process the colormesh fields of each write.
+                This runs once per MPI process, so keep max_threads * (number of processes) at or below the number of cores.
+            png_compress_level (int) :
+                The zlib compression level (0-9) of the output PNGs; low levels write much faster but make larger files.
             kwargs :
                 extra keyword args for matplotlib.pyplot.pcolormesh
         """
         with self.my_sync:
             axs, caxs = self._groom_grid()
-            tasks = []
-            for k, cm in self.colormeshes:
-                if cm.task not in tasks:
-                    tasks.append(cm.task)
+            #Unique task names, in the order they were added.
+            tasks = list(dict.fromkeys([cm.task for k, cm in self.colormeshes]))
+            slabs = list(dict.fromkeys([(cm.task, cm.vector_ind) for k, cm in self.colormeshes]))
             if self.idle: return
 
-            while self.writes_remain():
-#                for ax in axs: ax.clear()
-                for cax in caxs: cax.clear()
-                dsets, ni = self.get_dsets(tasks)
-                sim_time = self.current_file_handle['scales/sim_time'][ni]
-                write_num = self.current_file_handle['scales/write_number'][ni]
+            waves = self._get_processing_waves()
+            num_threads = max(1, min(max_threads, len(self.colormeshes)))
+            suptitle, bbox = None, None
+            with ThreadPoolExecutor(max_workers=num_threads) as executor:
+                field_map = map if num_threads == 1 else executor.map
+                while self.writes_remain():
+                    dsets, ni = self.get_dsets(tasks)
+                    #Read each task (or vector component) once per write, even if several colormeshes plot it.
+                    task_data = dict()
+                    for task, vector_ind in slabs:
+                        if vector_ind is None:
+                            task_data[(task, vector_ind)] = np.asarray(dsets[task][ni])
+                        else:
+                            task_data[(task, vector_ind)] = np.asarray(dsets[task][ni, vector_ind])
+                    sim_time = self.current_file_handle['scales/sim_time'][ni]
+                    write_num = self.current_file_handle['scales/write_number'][ni]
 #                time_data = dsets[self.colormeshes[0][1].task].dims[0]
-                for k, cm in self.colormeshes:
-                    ax = axs[k]
-                    cax = caxs[k]
-                    cm.plot_colormesh(ax, cax, dsets[cm.task], ni, **kwargs)
-                plt.suptitle('t = {:.4e}'.format(sim_time))
-                self.grid.fig.savefig('{:s}/{:s}_{:06d}.png'.format(self.out_dir, self.out_name, int(write_num+start_fig-1)), dpi=dpi, bbox_inches='tight')
-                
-                for k, cm in self.colormeshes:
-                    axs[k].cla()
-                    caxs[k].cla()
+
+                    #Field processing is mostly numpy work that releases the GIL, so do it in threads;
+                    #matplotlib is not thread-safe, so all plotting happens on this thread.
+                    process = lambda cm: cm.process_field(dsets[cm.task], task_data[(cm.task, cm.vector_ind)])
+                    fields = dict()
+                    for wave in waves:
+                        fields.update(zip(wave, field_map(process, wave)))
+                    for k, cm in self.colormeshes:
+                        ax = axs[k]
+                        cax = caxs[k]
+                        cm.plot_colormesh(ax, cax, fields[cm], **kwargs)
+                    if suptitle is None:
+                        suptitle = self.grid.fig.suptitle('t = {:.4e}'.format(sim_time))
+                    else:
+                        suptitle.set_text('t = {:.4e}'.format(sim_time))
+                    filename = '{:s}/{:s}_{:06d}.png'.format(self.out_dir, self.out_name, int(write_num+start_fig-1))
+                    if bbox is None:
+                        #The layout doesn't change between writes, so measure the tight bbox (at the output dpi) once and reuse it.
+                        self.grid.fig.set_dpi(dpi)
+                        bbox = self.grid.fig.get_tightbbox(self.grid.fig.canvas.get_renderer()).padded(matplotlib.rcParams['savefig.pad_inches'])
+                    self.grid.fig.savefig(filename, dpi=dpi, bbox_inches=bbox, pil_kwargs={'compress_level' : png_compress_level})
 